@@ -1,4 +1,4 @@
-from .compiler import compile
+from .compiler import compile, compile_batch
 from .noise import circuit_noise_model
 from .decoder import decode, DecoderError
 from .utils import load_qpy, load_qasm
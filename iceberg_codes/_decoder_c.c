@@ -0,0 +1,162 @@
+/*
+ * Optional C kernel for IcebergDecoder: syndrome checks and GF(2) decoding of a block of
+ * fixed-width ASCII measurement keys in a single pass.
+ *
+ * Each row of the block holds one measurement key. The last n characters are the data
+ * register of '0'/'1'; every preceding character must be '0' or a register separator ' '.
+ * Rows that break either rule are reported as invalid. Data bits
+ * are packed into 64-bit words so that both the parity check and every row of the decoder
+ * transform reduce to AND/XOR over words followed by a single parity.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+static int
+parity64(uint64_t x)
+{
+#if defined(__GNUC__) || defined(__clang__)
+    return __builtin_parityll(x);
+#else
+    x ^= x >> 32;
+    x ^= x >> 16;
+    x ^= x >> 8;
+    x ^= x >> 4;
+    x ^= x >> 2;
+    x ^= x >> 1;
+    return (int)(x & 1);
+#endif
+}
+
+static PyObject *
+decode_batch(PyObject *self, PyObject *args)
+{
+    Py_buffer rows, transform, valid, decoded;
+    Py_ssize_t width, n;
+    PyObject *result = NULL;
+    uint64_t *packed_transform = NULL;
+    uint64_t *state = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*nny*w*w*", &rows, &width, &n, &transform, &valid, &decoded)) {
+        return NULL;
+    }
+
+    if (n <= 0 || transform.len % n != 0 || (rows.len > 0 && (width < n || rows.len % width != 0))) {
+        PyErr_SetString(PyExc_ValueError, "inconsistent key width, data width or transform shape");
+        goto done;
+    }
+
+    /* An empty block has nothing to decode, whatever its nominal width */
+    Py_ssize_t shots = rows.len > 0 ? rows.len / width : 0;
+    Py_ssize_t k = transform.len / n;
+    Py_ssize_t words = (n + 63) / 64;
+    Py_ssize_t start = width - n;
+
+    if (valid.len < shots || decoded.len < shots * k) {
+        PyErr_SetString(PyExc_ValueError, "output buffers are too small");
+        goto done;
+    }
+
+    packed_transform = calloc((size_t)(k * words + 1), sizeof(uint64_t));
+    state = malloc((size_t)words * sizeof(uint64_t));
+    if (packed_transform == NULL || state == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    const uint8_t *t = (const uint8_t *)transform.buf;
+    for (Py_ssize_t r = 0; r < k; r++) {
+        for (Py_ssize_t j = 0; j < n; j++) {
+            if (t[r * n + j] & 1) {
+                packed_transform[r * words + j / 64] |= (uint64_t)1 << (j % 64);
+            }
+        }
+    }
+
+    const char *keys = (const char *)rows.buf;
+    uint8_t *valid_out = (uint8_t *)valid.buf;
+    uint8_t *decoded_out = (uint8_t *)decoded.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < shots; i++) {
+        const char *row = keys + i * width;
+        valid_out[i] = 0;
+
+        Py_ssize_t j = 0;
+        while (j < start && (row[j] == '0' || row[j] == ' ')) {
+            j++;
+        }
+        if (j < start) {
+            continue;
+        }
+
+        /* Any data byte other than '0'/'1' leaves the row invalid */
+        memset(state, 0, (size_t)words * sizeof(uint64_t));
+        for (j = 0; j < n; j++) {
+            char c = row[start + j];
+            if (c == '1') {
+                state[j / 64] |= (uint64_t)1 << (j % 64);
+            } else if (c != '0') {
+                break;
+            }
+        }
+        if (j < n) {
+            continue;
+        }
+
+        uint64_t acc = 0;
+        for (Py_ssize_t w = 0; w < words; w++) {
+            acc ^= state[w];
+        }
+        if (parity64(acc)) {
+            continue;
+        }
+
+        valid_out[i] = 1;
+        for (Py_ssize_t r = 0; r < k; r++) {
+            const uint64_t *t_row = packed_transform + r * words;
+            acc = 0;
+            for (Py_ssize_t w = 0; w < words; w++) {
+                acc ^= state[w] & t_row[w];
+            }
+            decoded_out[i * k + r] = (uint8_t)parity64(acc);
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    result = Py_None;
+    Py_INCREF(result);
+
+done:
+    free(packed_transform);
+    free(state);
+    PyBuffer_Release(&rows);
+    PyBuffer_Release(&transform);
+    PyBuffer_Release(&valid);
+    PyBuffer_Release(&decoded);
+    return result;
+}
+
+static PyMethodDef decoder_methods[] = {
+    {"decode_batch", decode_batch, METH_VARARGS,
+     "decode_batch(rows, width, n, transform, valid, decoded)\n\n"
+     "Checks syndromes and decodes a C-contiguous block of fixed-width ASCII keys. Writes the\n"
+     "validity of every row into `valid` and its decoded bits into the (rows, k) `decoded` buffer."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef decoder_module = {
+    PyModuleDef_HEAD_INIT,
+    "_decoder_c",
+    "Optional C kernel for the Iceberg decoder.",
+    -1,
+    decoder_methods
+};
+
+PyMODINIT_FUNC
+PyInit__decoder_c(void)
+{
+    return PyModule_Create(&decoder_module);
+}
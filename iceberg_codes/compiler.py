@@ -1,10 +1,48 @@
 import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import requests
+from requests.adapters import HTTPAdapter
 from qiskit import QuantumCircuit, qpy
 
 ENDPOINT = "https://api.codeqraft.xyz/compile"
 
+_POOL_SIZE = 16
+
+
+def _make_session(pool_size: int) -> requests.Session:
+    """Creates a session whose HTTPS connection pool keeps up to `pool_size` connections alive."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+    return session
+
+
+# Shared session so repeated compilations reuse pooled connections instead of a new TCP+TLS handshake each.
+# compile_batch uses it from several threads at once; it is only ever used to post requests, never reconfigured.
+_SESSION = _make_session(_POOL_SIZE)
+
+
+def _compile_one(qc: QuantumCircuit, syndrome_rate: int, session: requests.Session) -> QuantumCircuit:
+    """Sends a single circuit to the compilation API over the given session and returns the compiled circuit."""
+    buf = BytesIO()
+    qpy.dump(qc, buf)
+    qpy_b64 = base64.b64encode(buf.getbuffer())
+
+    # Base64 output never needs JSON escaping, so the request body is assembled directly from
+    # bytes instead of decoding to str and re-encoding the whole payload through json.dumps.
+    payload = b''.join([
+        b'{"qpy_base64": "', qpy_b64, b'", ',
+        b'"syndrome_rate": ', json.dumps(syndrome_rate, allow_nan=False).encode('ascii'), b'}'
+    ])
+
+    response = session.post(ENDPOINT, data=payload, headers={"Content-Type": "application/json"})
+    if response.status_code != 200:
+        raise ValueError(response.text)
+
+    buf = BytesIO(base64.b64decode(response.json()["qpy_base64"]))
+    return qpy.load(buf)[0]
+
 
 def compile(qc: QuantumCircuit, syndrome_rate: int = 16) -> QuantumCircuit:
     """
@@ -31,22 +69,50 @@ def compile(qc: QuantumCircuit, syndrome_rate: int = 16) -> QuantumCircuit:
         ValueError:
             If the compilation API returns an unsuccessful response or encounters an error during compilation.
     """
+    return _compile_one(qc, syndrome_rate, _SESSION)
 
-    buf = BytesIO()
-    qpy.dump(qc, buf)
-    qpy_bytes = buf.getvalue()
-    qpy_b64 = base64.b64encode(qpy_bytes).decode('utf-8')
 
-    payload = {
-        "qpy_base64": qpy_b64,
-        "syndrome_rate": syndrome_rate
-    }
+def compile_batch(
+    qcs: list[QuantumCircuit], syndrome_rate: int = 16, max_workers: int | None = 8
+) -> list[QuantumCircuit]:
+    """
+    Compiles several quantum circuits with Iceberg's remote compilation API, overlapping the requests.
 
-    response = requests.post(ENDPOINT, json=payload)
-    if response.status_code != 200:
-        raise ValueError(response.text)
+    Each circuit is compiled exactly as by `compile`; the HTTP round-trips are issued concurrently from a
+    thread pool, all sharing one `requests.Session` and its connection pool, which makes parameter sweeps
+    over many circuits much faster.
 
-    data = response.json()
-    compiled_bytes = base64.b64decode(data["qpy_base64"])
-    buf = BytesIO(compiled_bytes)
-    return qpy.load(buf)[0]
+    Parameters:
+        qcs (list[QuantumCircuit]):
+            The input quantum circuits to compile.
+
+        syndrome_rate (int, optional):
+            The frequency (in gate layers) at which syndrome measurements are inserted for error detection.
+            Default is 16.
+
+        max_workers (int | None, optional):
+            Maximum number of concurrent compilation requests. Default is 8; None uses 16. Up to 16 workers
+            share the module's pooled session; larger values get a dedicated session with a pool of that size
+            for the duration of the call, so every worker can keep its connection.
+
+    Returns:
+        list[QuantumCircuit]:
+            The compiled circuits, in the same order as `qcs`.
+
+    Raises:
+        ValueError:
+            If `max_workers` is less than 1, or if the compilation API returns an unsuccessful response
+            for any of the circuits.
+    """
+    if max_workers is None:
+        max_workers = _POOL_SIZE
+    if max_workers < 1:
+        raise ValueError(f'max_workers must be at least 1, got {max_workers}')
+
+    session = _SESSION if max_workers <= _POOL_SIZE else _make_session(max_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(lambda qc: _compile_one(qc, syndrome_rate, session), qcs))
+    finally:
+        if session is not _SESSION:
+            session.close()
@@ -1,5 +1,17 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING
 import numpy as np
-import qiskit_aer
+
+if TYPE_CHECKING:
+    import qiskit_aer
+
+try:
+    from . import _decoder_c
+except ImportError:
+    _decoder_c = None
 
 
 class DecoderError(Exception):
@@ -37,12 +49,12 @@ class DecodedResults:
         self.counts = counts
         self.invalid = invalid
         self.valid_count = sum(counts.values())
-        self.shots = invalid + sum(counts.values())
+        self.shots = invalid + self.valid_count
         self.survival_rate = self.valid_count / self.shots
-        self._probabilities_dict = {k: v / self.valid_count for k, v in self.counts.items()}
+        self._probabilities_dict = None
 
     def __str__(self):
-        counts = '{' + ', '.join([f'{a}: {b}' for a, b in list(self.counts.items())[:3]]) + ', ...}'
+        counts = '{' + ', '.join([f'{a}: {b}' for a, b in islice(self.counts.items(), 3)]) + ', ...}'
         return (f'DecodedResults(shots={self.shots}, '
                 f'survival_rate={self.survival_rate}, '
                 f'invalid={self.invalid}, '
@@ -56,9 +68,79 @@ class DecodedResults:
             dict[str, float]:
                 Mapping of decoded bitstrings to their probabilities.
         """
+        if self._probabilities_dict is None:
+            self._probabilities_dict = {k: v / self.valid_count for k, v in self.counts.items()}
         return self._probabilities_dict
 
 
+def _c_decode_kernel(rows, n, transform):
+    """
+    Checks syndromes and decodes a (shots, width) block of ASCII measurement keys with the C extension.
+
+    Same contract as the numba kernel: returns the validity mask and the decoded bits of every row.
+    """
+    valid = np.zeros(rows.shape[0], dtype=np.bool_)
+    decoded = np.zeros((rows.shape[0], transform.shape[0]), dtype=np.uint8)
+    _decoder_c.decode_batch(rows, rows.shape[1], n, transform, valid, decoded)
+    return valid, decoded
+
+
+def _numba_decode_kernel():
+    """Compiles the parallel numba decoding kernel, or returns None if numba is not installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def kernel(rows, n, transform):
+        """
+        Checks syndromes and decodes a (shots, width) block of ASCII measurement keys in parallel.
+
+        The last n characters of each row are the data register; every other character must be
+        '0' or a register separator. Returns the validity mask and the decoded bits of every row.
+        """
+        shots, width = rows.shape
+        k = transform.shape[0]
+        start = width - n
+        valid = np.zeros(shots, dtype=np.bool_)
+        decoded = np.zeros((shots, k), dtype=np.uint8)
+        for i in numba.prange(shots):
+            ok = True
+            for j in range(start):
+                if rows[i, j] != 48 and rows[i, j] != 32:
+                    ok = False
+                    break
+            if not ok:
+                continue
+            parity = 0
+            for j in range(start, width):
+                parity ^= rows[i, j] - 48
+            if parity != 0:
+                continue
+            valid[i] = True
+            for r in range(k):
+                acc = 0
+                for j in range(n):
+                    acc ^= (rows[i, start + j] - 48) & transform[r, j]
+                decoded[i, r] = acc
+        return valid, decoded
+
+    return kernel
+
+
+@lru_cache(maxsize=None)
+def _select_decode_kernel():
+    """
+    Picks the decoding kernel on first use: the C extension, then numba, or None for the NumPy path.
+
+    Selection is deferred to the first decode so that importing the package never imports numba.
+    """
+    if _decoder_c is not None:
+        return _c_decode_kernel
+    return _numba_decode_kernel()
+
+
 class IcebergDecoder:
     """
     Decodes quantum circuit measurement results using the Iceberg error-detecting code.
@@ -78,9 +160,34 @@ class IcebergDecoder:
         self.k = k + k % 2
         self.n = k + 2
         tf = np.concatenate(
-            [np.zeros((k, 1), dtype=bool), (1 - np.eye(k, dtype=bool)), np.ones((k, 1), dtype=bool)], -1
+            [np.zeros((k, 1), dtype=np.uint8), (1 - np.eye(k, dtype=np.uint8)), np.ones((k, 1), dtype=np.uint8)], -1
         )
         self._decoder_transform = np.concat((tf[0][None, ...], tf[1:][::-1]))
+        self._decoder_transform_t = np.ascontiguousarray(self._decoder_transform.T)
+
+    def _key_block(self, keys: list[str]) -> np.ndarray:
+        """
+        Joins measurement keys into one (shots, width) ASCII block.
+
+        Iceberg circuits have fixed register widths, so every key must have the same length and end
+        in an n-character data register of '0'/'1', preceded by a space if there are flag registers.
+
+        Raises:
+            DecoderError:
+                If the keys do not share such a layout.
+        """
+        joined = ''.join(keys)
+        width = len(keys[0]) if keys else 0
+        if len(joined) == len(keys) * width:
+            rows = np.frombuffer(joined.encode('ascii'), dtype=np.uint8).reshape(len(keys), width)
+            if not keys:
+                return rows
+            separated = width == self.n or (width > self.n and (rows[:, -self.n - 1] == ord(' ')).all())
+            # '0' | 1 == '1' | 1 == '1', and no other byte maps to '1'
+            if separated and ((rows[:, -self.n:] | 1) == ord('1')).all():
+                return rows
+        raise DecoderError(f'Measurement keys must share one register layout ending in a '
+                           f'{self.n}-bit data register; check k and the register layout')
 
     def __call__(self, counts: dict[str, int]) -> DecodedResults:
         """
@@ -90,6 +197,8 @@ class IcebergDecoder:
         Parameters:
             counts (dict[str, int]):
                 A dictionary mapping measurement bitstrings to their corresponding counts.
+                All keys must share the same register layout (as produced by a single compiled
+                circuit), ending in the n-bit data register.
 
         Returns:
             DecodedResults:
@@ -97,36 +206,58 @@ class IcebergDecoder:
 
         Raises:
             DecoderError:
-                If no valid measurement outcomes pass syndrome checks.
+                If the keys do not share one register layout ending in an n-bit data register,
+                or if no valid measurement outcomes pass syndrome checks.
         """
-        invalid = 0
-        count_vals = []
-        states = []
-        for k, v in counts.items():
-            regs = k.split()
-            flags = np.array(regs[:-1], dtype=int)
-            data = np.array(list(regs[-1]), dtype=int)
-            syndrome_check_passed = np.all(flags == 0) and ((data.sum() % 2) == 0)
-            if syndrome_check_passed:
-                count_vals.append(v)
-                states.append(data)
-            else:
-                invalid += v
-
-        if len(states) == 0:
+        keys = list(counts)
+        # Keep the dtype of the counts so that non-integer weights are not truncated
+        vals = np.array(list(counts.values()))
+
+        rows = self._key_block(keys)
+
+        kernel = _select_decode_kernel()
+        if kernel is not None:
+            valid, decoded = kernel(rows, self.n, self._decoder_transform)
+            decoded = decoded[valid]
+        else:
+            flag_chars = rows[:, :-self.n]
+            flags_ok = ~((flag_chars != ord('0')) & (flag_chars != ord(' '))).any(axis=1)
+
+            # Only shots whose flags are all zero need their data register parsed
+            data = rows[flags_ok, -self.n:].reshape(-1, self.n) - ord('0')
+            parity_ok = (data.sum(axis=1) & 1) == 0
+            valid = flags_ok.copy()
+            valid[flags_ok] = parity_ok
+
+            # uint8 accumulation wraps modulo 256, which preserves the parity of the GF(2) product
+            decoded = (data[parity_ok] @ self._decoder_transform_t) & 1
+
+        invalid = np.asarray(vals[~valid].sum()).item()
+        count_vals = vals[valid]
+
+        if len(count_vals) == 0:
             raise DecoderError('Syndrome checks failed for all shots! Consider (1) reducing your '
                                'circuit complexity and/or (2) increasing the number of samples')
 
-        states = np.array(states)
+        # Group identical decoded rows on their packed bytes and sum their counts
+        width = decoded.shape[1]
+        packed = np.packbits(decoded, axis=1)
+        unique_rows, inverse = np.unique(packed, axis=0, return_inverse=True)
+        # np.add.at sums in the dtype of the counts, so integer totals stay exact beyond 2**53
+        totals = np.zeros(len(unique_rows), dtype=count_vals.dtype)
+        np.add.at(totals, inverse.ravel(), count_vals)
+        # View each row of ASCII digits as one fixed-width byte string to build all keys at once
+        unique_chars = np.ascontiguousarray(np.unpackbits(unique_rows, axis=1)[:, :width] + ord('0'))
+        unique_keys = unique_chars.view(f'S{width}').ravel().astype(str)
+        decoded_counts = dict(zip(unique_keys.tolist(), totals.tolist()))
 
-        decoded = (states @ self._decoder_transform.T) % 2
+        return DecodedResults(decoded_counts, invalid)
 
-        decoded_counts = {}
-        for s, c in zip(decoded, count_vals):
-            s = ''.join(map(str, s))
-            decoded_counts[s] = decoded_counts.get(s, 0) + c
 
-        return DecodedResults(decoded_counts, invalid)
+@lru_cache(maxsize=32)
+def _get_decoder(k: int) -> IcebergDecoder:
+    """Returns a shared IcebergDecoder for k; decoders hold no per-call state, so reuse is safe."""
+    return IcebergDecoder(k)
 
 
 def decode(counts: dict[str, int] | qiskit_aer.jobs.aerjob.AerJob, k: int) -> DecodedResults:
@@ -146,7 +277,13 @@ def decode(counts: dict[str, int] | qiskit_aer.jobs.aerjob.AerJob, k: int) -> De
         DecodedResults:
             Object containing decoded outcomes and statistics.
     """
-    dec = IcebergDecoder(k)
-    if isinstance(counts, qiskit_aer.jobs.aerjob.AerJob):
+    # qiskit_aer is imported lazily so that using the decoder does not pay for loading Aer
+    try:
+        from qiskit_aer.jobs.aerjob import AerJob
+    except ImportError:
+        AerJob = None
+
+    dec = _get_decoder(k)
+    if AerJob is not None and isinstance(counts, AerJob):
         counts = counts.result().get_counts()
     return dec(counts)
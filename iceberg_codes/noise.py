@@ -1,6 +1,25 @@
+from __future__ import annotations
+
+from functools import lru_cache
 from itertools import product
-from qiskit_aer import AerSimulator
-from qiskit_aer.noise import NoiseModel, ReadoutError, pauli_error
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit_aer import AerSimulator
+    from qiskit_aer.noise import QuantumError
+
+# Non-identity Pauli errors, built once at import
+_SINGLE_QUBIT_ERRORS = ('X', 'Y', 'Z')
+_TWO_QUBIT_ERRORS = tuple(''.join(err) for err in product('XYZI', repeat=2) if err != ('I', 'I'))
+
+
+@lru_cache(maxsize=128)
+def _uniform_pauli_error(errors: tuple[str, ...], identity: str, p: float) -> QuantumError:
+    """Returns a Pauli channel applying each of `errors` with probability p / len(errors), and `identity` otherwise."""
+    from qiskit_aer.noise import pauli_error
+
+    p_error = p / len(errors)
+    return pauli_error(list(zip(errors + (identity,), [p_error] * len(errors) + [1 - p])))
 
 
 def parametric_circuit_noise_model(p_single_qubit: float, p_two_qubit: float, p_measure: float) -> AerSimulator:
@@ -24,27 +43,18 @@ def parametric_circuit_noise_model(p_single_qubit: float, p_two_qubit: float, p_
         AerSimulator:
             A Qiskit Aer simulator configured with the specified noise model.
     """
+    from qiskit_aer import AerSimulator
+    from qiskit_aer.noise import NoiseModel, ReadoutError
+
     noise_model = NoiseModel()
 
     # Two-Qubit Pauli Error
     if p_two_qubit is not None:
-        two_qubits_errors = [
-            ''.join(err) for err in product(['X', 'Y', 'Z', 'I'], repeat=2)
-            if err != ('I', 'I')
-        ]
-        n_two_qubits_errors = len(two_qubits_errors)
-        two_qubit_pauli_error = pauli_error(
-            [(err, p_two_qubit / n_two_qubits_errors) for err in two_qubits_errors] +
-            [('II', 1 - p_two_qubit)]
-        )
+        two_qubit_pauli_error = _uniform_pauli_error(_TWO_QUBIT_ERRORS, 'II', p_two_qubit)
         noise_model.add_all_qubit_quantum_error(two_qubit_pauli_error, ['cx', 'rzz'])
 
     # Single-Qubit Pauli Error
-    single_qubit_errors = ['X', 'Y', 'Z']
-    single_qubit_pauli_error = pauli_error(
-        [(err, p_single_qubit / 3) for err in single_qubit_errors] +
-        [('I', 1 - p_single_qubit)]
-    )
+    single_qubit_pauli_error = _uniform_pauli_error(_SINGLE_QUBIT_ERRORS, 'I', p_single_qubit)
     noise_model.add_all_qubit_quantum_error(single_qubit_pauli_error, ['u', 'h', 'x', 'y', 'z', 'id'])
 
     # Measurement Error
@@ -52,10 +62,7 @@ def parametric_circuit_noise_model(p_single_qubit: float, p_two_qubit: float, p_
         meas_error = ReadoutError([[1 - p_measure, p_measure], [p_measure, 1 - p_measure]])
         noise_model.add_all_qubit_readout_error(meas_error)
 
-        reset_error = pauli_error(
-            [(err, p_measure / 3) for err in single_qubit_errors] +
-            [('I', 1 - p_measure)]
-        )
+        reset_error = _uniform_pauli_error(_SINGLE_QUBIT_ERRORS, 'I', p_measure)
         noise_model.add_all_qubit_quantum_error(reset_error, ['reset'])
 
     return AerSimulator(noise_model=noise_model)
@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 
 setup(
     name="iceberg_codes",
@@ -8,6 +8,15 @@ setup(
     author_email="tom@beit.tech",
     url="https://github.com/beittech/iceberg.git",
     packages=find_packages(),
+    ext_modules=[
+        # Optional fast path for the decoder; the package falls back to numba/NumPy if it cannot be built
+        Extension(
+            "iceberg_codes._decoder_c",
+            sources=["iceberg_codes/_decoder_c.c"],
+            extra_compile_args=["-O3"],
+            optional=True,
+        ),
+    ],
     install_requires=[
         "qiskit>=1.4.0",
         "qiskit-aer>=0.16.4",
@@ -27,5 +36,6 @@ setup(
     },
     extras_require={
         "dev": ["jupyter", "matplotlib", "tqdm", "seaborn", "pandas"],
+        "numba": ["numba"],
     },
 )
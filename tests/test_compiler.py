@@ -0,0 +1,77 @@
+import base64
+import json
+from io import BytesIO
+from unittest import mock
+
+import pytest
+from qiskit import QuantumCircuit, qpy
+
+from iceberg_codes import compiler
+
+
+def _echo_response(data):
+    """Builds a successful API response that returns the submitted circuit unchanged."""
+    response = mock.Mock(status_code=200)
+    response.json.return_value = {'qpy_base64': json.loads(data)['qpy_base64']}
+    return response
+
+
+def test_compile_sends_json():
+    qc = QuantumCircuit(2)
+    qc.cx(0, 1)
+
+    def post(url, data=None, headers=None):
+        assert headers['Content-Type'] == 'application/json'
+        assert json.loads(data)['syndrome_rate'] == 8
+        return _echo_response(data)
+
+    with mock.patch.object(compiler._SESSION, 'post', side_effect=post):
+        assert compiler.compile(qc, syndrome_rate=8) == qc
+
+
+def test_compile_rejects_nan_syndrome_rate():
+    with mock.patch.object(compiler._SESSION, 'post') as post:
+        with pytest.raises(ValueError):
+            compiler.compile(QuantumCircuit(1), syndrome_rate=float('nan'))
+    post.assert_not_called()
+
+
+def _circuits(n):
+    return [QuantumCircuit(i + 1) for i in range(n)]
+
+
+@pytest.mark.parametrize('max_workers', [1, 8, None])
+def test_compile_batch_keeps_order(max_workers):
+    qcs = _circuits(20)
+    with mock.patch.object(compiler._SESSION, 'post', side_effect=lambda url, data, headers: _echo_response(data)):
+        compiled = compiler.compile_batch(qcs, max_workers=max_workers)
+    assert [qc.num_qubits for qc in compiled] == list(range(1, 21))
+
+
+def test_compile_batch_large_pool_keeps_order():
+    qcs = _circuits(20)
+    with mock.patch.object(compiler.requests.Session, 'post',
+                           side_effect=lambda url, data, headers: _echo_response(data)) as post, \
+            mock.patch.object(compiler, '_make_session', wraps=compiler._make_session) as make_session:
+        compiled = compiler.compile_batch(qcs, max_workers=32)
+    assert [qc.num_qubits for qc in compiled] == list(range(1, 21))
+    assert post.call_count == 20
+    make_session.assert_called_once_with(32)
+
+
+def test_compile_batch_raises_on_failure():
+    def post(url, data=None, headers=None):
+        qpy_bytes = base64.b64decode(json.loads(data)['qpy_base64'])
+        if qpy.load(BytesIO(qpy_bytes))[0].num_qubits == 3:
+            return mock.Mock(status_code=500, text='compilation failed')
+        return _echo_response(data)
+
+    with mock.patch.object(compiler._SESSION, 'post', side_effect=post):
+        with pytest.raises(ValueError, match='compilation failed'):
+            compiler.compile_batch(_circuits(5))
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_compile_batch_rejects_invalid_workers(max_workers):
+    with pytest.raises(ValueError, match='max_workers'):
+        compiler.compile_batch(_circuits(2), max_workers=max_workers)
@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+import pytest
+
+from iceberg_codes import decoder
+from iceberg_codes.decoder import DecoderError, IcebergDecoder
+
+
+def _reference_decode(counts, k):
+    """Per-key reference decoder, equivalent to the original IcebergDecoder implementation."""
+    n = k + 2
+    tf = np.concatenate([np.zeros((k, 1), dtype=int), 1 - np.eye(k, dtype=int), np.ones((k, 1), dtype=int)], -1)
+    transform = np.concatenate((tf[0][None, ...], tf[1:][::-1]))
+    invalid = 0
+    decoded_counts = {}
+    for key, v in counts.items():
+        regs = key.split()
+        flags = np.array(regs[:-1], dtype=int)
+        data = np.array(list(regs[-1]), dtype=int)
+        assert len(data) == n
+        if np.all(flags == 0) and data.sum() % 2 == 0:
+            s = ''.join(map(str, (transform @ data) % 2))
+            decoded_counts[s] = decoded_counts.get(s, 0) + v
+        else:
+            invalid += v
+    return decoded_counts, invalid
+
+
+def _random_counts(rng, k, n_flags, n_keys, p_flag=0.25):
+    counts = {}
+    for _ in range(n_keys):
+        flags = ' '.join('1' if rng.random() < p_flag else '0' for _ in range(n_flags))
+        data = ''.join(rng.choice('01') for _ in range(k + 2))
+        key = f'{flags} {data}' if n_flags else data
+        counts[key] = counts.get(key, 0) + rng.randint(1, 5)
+    return counts
+
+
+def _kernels():
+    kernels = [pytest.param(None, id='numpy')]
+    if decoder._decoder_c is not None:
+        kernels.append(pytest.param(decoder._c_decode_kernel, id='c'))
+    numba_kernel = decoder._numba_decode_kernel()
+    if numba_kernel is not None:
+        kernels.append(pytest.param(numba_kernel, id='numba'))
+    return kernels
+
+
+@pytest.fixture(params=_kernels())
+def kernel(request, monkeypatch):
+    monkeypatch.setattr(decoder, '_select_decode_kernel', lambda: request.param)
+
+
+def test_empty_counts(kernel):
+    with pytest.raises(DecoderError):
+        IcebergDecoder(3)({})
+
+
+@pytest.mark.parametrize('k, counts', [
+    (2, {'00 0000': 1, '0 0000': 1}),
+    (2, {'0 00000': 1}),
+    (2, {'0 0 0000': 1, '0 00 000': 1}),
+    (6, {'0 0 000000': 1}),
+])
+def test_inconsistent_layout(kernel, k, counts):
+    with pytest.raises(DecoderError, match='register layout'):
+        IcebergDecoder(k)(counts)
+
+
+def test_invalid_data_bytes(kernel):
+    with pytest.raises(DecoderError, match='register layout'):
+        IcebergDecoder(2)({'0 002a': 1, '0 0000': 1})
+
+
+@pytest.mark.skipif(decoder._decoder_c is None, reason='C extension not built')
+def test_c_kernel_rejects_invalid_data_bytes():
+    rows = np.frombuffer(b'0 002a0 0000', dtype=np.uint8).reshape(2, 6)
+    valid, decoded = decoder._c_decode_kernel(rows, 4, IcebergDecoder(2)._decoder_transform)
+    assert valid.tolist() == [False, True]
+
+
+def test_large_counts_stay_exact(kernel):
+    result = IcebergDecoder(2)({'0 0000': 2 ** 60 + 1, '0 1111': 2 ** 60})
+    assert result.counts == {'00': 2 ** 61 + 1}
+
+
+@pytest.mark.parametrize('k', [1, 2, 5, 20, 63, 70])
+@pytest.mark.parametrize('n_flags', [0, 1, 3])
+def test_matches_reference(kernel, k, n_flags):
+    counts = _random_counts(random.Random(k * 10 + n_flags), k, n_flags, 500)
+    expected_counts, expected_invalid = _reference_decode(counts, k)
+
+    result = IcebergDecoder(k)(counts)
+
+    assert result.counts == expected_counts
+    assert result.invalid == expected_invalid
+    assert all(type(v) is int for v in result.counts.values())
+    assert type(result.invalid) is int
+
+
+def test_fractional_counts(kernel):
+    counts = {'0 0000': 0.5, '0 1100': 0.25, '1 0000': 0.25}
+    expected_counts, expected_invalid = _reference_decode(counts, 2)
+
+    result = IcebergDecoder(2)(counts)
+
+    assert result.counts == expected_counts
+    assert result.invalid == expected_invalid
+    assert result.survival_rate == 0.75
+
+
+def test_all_invalid(kernel):
+    counts = {'1 0 00000': 4, '0 0 10000': 2, '0 1 11000': 1}
+    with pytest.raises(DecoderError):
+        IcebergDecoder(3)(counts)